@@ -13,20 +13,55 @@ Flow:
 
 from __future__ import annotations
 
+import functools
 import json
 import os
 import subprocess
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 from urllib import error as url_error
 from urllib import request as url_request
 
+try:  # optional: keep-alive connection pooling when available
+    import urllib3
+except ImportError:
+    urllib3 = None
+
+# Optional C JSON codec for the hot request path; orjson serializes straight
+# to bytes (no .encode step), ujson is the next-best, stdlib always works.
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+
+    def _json_dumps_bytes(obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+except ImportError:
+    try:
+        import ujson
+
+        _json_loads = ujson.loads
+
+        def _json_dumps_bytes(obj: Any) -> bytes:
+            return ujson.dumps(obj).encode("utf-8")
+
+    except ImportError:
+        _json_loads = json.loads
+
+        def _json_dumps_bytes(obj: Any) -> bytes:
+            return json.dumps(obj).encode("utf-8")
+
 from opentrons import types
 
+# The home envelope never varies; serialize it once for the bytes fast path.
+_HOME_BODY = _json_dumps_bytes({"data": {"commandType": "home", "params": {}}})
+
 TEST_FRACTION = 0.10
 
 HOST_ENV_KEY = "OT2_HOST"
@@ -50,6 +85,14 @@ API_VERSION = "2"
 HTTP_TIMEOUT_SECONDS = 20.0
 COMMAND_TIMEOUT_SECONDS = 180.0
 POLL_INTERVAL_SECONDS = 0.20
+# Command polls start fast (to catch trivially quick commands in one RTT)
+# and back off toward a cap for the multi-second moves/aspirates.
+POLL_INITIAL_DELAY_SECONDS = 0.05
+POLL_BACKOFF_FACTOR = 1.7
+POLL_MAX_DELAY_SECONDS = 1.0
+# Back-to-back run-status reads (idle wait straight into cleanup) coalesce
+# within this window instead of issuing duplicate GETs.
+RUN_STATUS_CACHE_TTL_SECONDS = 0.1
 
 TIPRACK_NAMESPACE = "opentrons"
 TIPRACK_VERSION = 1
@@ -75,13 +118,41 @@ TRANSFER_PLATE_CANDIDATES = [
 ]
 DEFINITIONS_DIR = Path(__file__).resolve().parent / "definitions"
 HOST_RESOLVER = Path(__file__).resolve().parent / "ot2_resolve_host.py"
+HOST_CACHE_PATH = Path.home() / ".cache" / "ot2_smoke" / "host"
+HOST_CACHE_TTL_SECONDS = 600.0
 LabwareCandidate = tuple[str, str, int]
 
 
+def _read_cached_host() -> str:
+    try:
+        if time.time() - HOST_CACHE_PATH.stat().st_mtime <= HOST_CACHE_TTL_SECONDS:
+            return HOST_CACHE_PATH.read_text(encoding="utf-8").strip()
+    except OSError:
+        pass
+    return ""
+
+
+def _write_cached_host(host: str) -> None:
+    try:
+        HOST_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        tmp = HOST_CACHE_PATH.with_suffix(".tmp")
+        tmp.write_text(host + "\n", encoding="utf-8")
+        os.replace(tmp, HOST_CACHE_PATH)
+    except OSError:
+        pass
+
+
 def _resolve_host() -> str:
     explicit = os.getenv(HOST_ENV_KEY, "").strip()
     if explicit:
         return explicit
+    # The robot's address rarely changes between back-to-back runs; a fresh
+    # cache entry skips the resolver subprocess (full interpreter startup
+    # plus discovery probing). A stale/wrong entry only costs the first
+    # /health call, which fails fast and surfaces the real resolver path.
+    cached = _read_cached_host()
+    if cached:
+        return cached
     if not HOST_RESOLVER.is_file():
         return DEFAULT_HOST
     proc = subprocess.run(
@@ -100,14 +171,18 @@ def _resolve_host() -> str:
     if proc.returncode == 0:
         resolved = (proc.stdout or "").strip()
         if resolved:
+            _write_cached_host(resolved)
             return resolved
     detail = (proc.stderr or proc.stdout or "").strip() or f"exit code {proc.returncode}"
     raise RuntimeError(f"Failed to auto-resolve OT-2 host. Set {HOST_ENV_KEY} or pass --host via wrapper.\n{detail}")
 
 
 def _log_stderr(level: str, message: str) -> None:
-    timestamp = datetime.now(timezone.utc).isoformat(timespec="seconds")
-    print(f"{timestamp} [{level}] {message}", file=sys.stderr, flush=True)
+    # time.strftime over gmtime is one C call with no datetime allocation.
+    # Keep the per-line flush: log order relative to operator prompts matters.
+    timestamp = time.strftime("%Y-%m-%dT%H:%M:%S+00:00", time.gmtime())
+    sys.stderr.write(f"{timestamp} [{level}] {message}\n")
+    sys.stderr.flush()
 
 
 def _input_required() -> None:
@@ -157,14 +232,23 @@ def _prompt_manual_tip_discard(mount_name: str, pipette_name: str) -> None:
         print("Press Enter once the tip is in trash.", file=sys.stderr, flush=True)
 
 
+@functools.lru_cache(maxsize=None)
+def _load_deck(deck_name: str, version: int) -> Optional[Dict[str, Any]]:
+    deck_path = DEFINITIONS_DIR / str(version) / f"{deck_name}.json"
+    try:
+        return _json_loads(deck_path.read_bytes())
+    except Exception:  # noqa: BLE001
+        return None
+
+
+# Each deck JSON is parsed at most once per process and every slot lookup
+# after the first is a cache hit — mount moves repeat the same slots.
+@functools.lru_cache(maxsize=None)
 def _slot_center(slot_id: str) -> types.Point:
     for deck_name in ("ot2_short_trash", "ot2_standard"):
         for version in (3, 4, 5):
-            try:
-                deck_path = DEFINITIONS_DIR / str(version) / f"{deck_name}.json"
-                with deck_path.open("r", encoding="utf-8") as f:
-                    deck = json.load(f)
-            except Exception:  # noqa: BLE001
+            deck = _load_deck(deck_name, version)
+            if deck is None:
                 continue
             slots = deck.get("locations", {}).get("orderedSlots", [])
             if not isinstance(slots, list):
@@ -211,39 +295,51 @@ class RobotServerClient:
         self._headers = {
             "opentrons-version": api_version,
             "Content-Type": "application/json",
-            "Connection": "close",
         }
+        # One keep-alive socket serves the whole run when urllib3 is present;
+        # the poll loops otherwise pay a TCP handshake per 200 ms request.
+        self._pool = (
+            urllib3.HTTPConnectionPool(normalized_host, port=API_PORT, maxsize=4, retries=False)
+            if urllib3
+            else None
+        )
+        # Poll loops sleep on this event instead of time.sleep, so anything
+        # that learns a command finished early (another thread, a signal
+        # handler) can set() it to cut the wait short.
+        self._wake = threading.Event()
+        self._run_status_cache: Dict[str, tuple[float, Optional[str]]] = {}
 
     def _request_json(
         self,
         method: str,
         path: str,
-        body: Optional[Dict[str, Any]] = None,
+        body: Optional[Dict[str, Any] | bytes] = None,
         expected_statuses: tuple[int, ...] = (200,),
         retries: int = 0,
     ) -> Dict[str, Any]:
-        payload_bytes = None if body is None else json.dumps(body).encode("utf-8")
-        url = f"{self._base_url}{path}"
+        # bytes bodies are sent as-is, so constant command envelopes can be
+        # serialized once (see _HOME_BODY) instead of per call.
+        if body is None or isinstance(body, bytes):
+            payload_bytes = body
+        else:
+            payload_bytes = _json_dumps_bytes(body)
+
+        if self._pool is not None:
+            # urllib3.Retry handles the backoff-and-retry on the pooled
+            # socket; no Python-side loop, no re-dial per attempt.
+            try:
+                status, payload = self._request_via_pool(method, path, payload_bytes, retries)
+            except Exception as exc:  # noqa: BLE001
+                raise ApiRequestError(f"{method} {path} failed: {exc}") from exc
+            if status in expected_statuses:
+                return payload
+            raise ApiRequestError(
+                f"{method} {path} returned {status}: {self._error_message(payload)}"
+            )
 
         for attempt in range(retries + 1):
-            req = url_request.Request(
-                url=url,
-                data=payload_bytes,
-                method=method,
-                headers=self._headers,
-            )
             try:
-                with url_request.urlopen(req, timeout=HTTP_TIMEOUT_SECONDS) as resp:
-                    status = resp.getcode()
-                    raw = resp.read().decode("utf-8")
-                    payload = json.loads(raw) if raw else {}
-            except url_error.HTTPError as exc:
-                status = exc.code
-                raw = exc.read().decode("utf-8")
-                try:
-                    payload = json.loads(raw) if raw else {}
-                except Exception:  # noqa: BLE001
-                    payload = {"raw": raw}
+                status, payload = self._request_via_urllib(method, path, payload_bytes)
             except Exception as exc:  # noqa: BLE001
                 if attempt < retries:
                     time.sleep(POLL_INTERVAL_SECONDS)
@@ -261,6 +357,62 @@ class RobotServerClient:
 
         raise ApiRequestError(f"{method} {path} failed after retries.")
 
+    def _request_via_pool(
+        self, method: str, path: str, payload_bytes: Optional[bytes], retries: int = 0
+    ) -> tuple[int, Dict[str, Any]]:
+        retry_policy: Any = False
+        if retries:
+            # allowed_methods=None retries POST/DELETE too, matching the old
+            # inline loop; raise_on_status=False hands terminal statuses back
+            # so the caller's expected_statuses check stays the arbiter.
+            retry_policy = urllib3.Retry(
+                total=retries,
+                backoff_factor=0.1,
+                status_forcelist=(500, 502, 503, 504),
+                allowed_methods=None,
+                raise_on_status=False,
+            )
+        resp = self._pool.request(
+            method,
+            path,
+            body=payload_bytes,
+            headers=self._headers,
+            timeout=HTTP_TIMEOUT_SECONDS,
+            retries=retry_policy,
+        )
+        raw = resp.data
+        try:
+            # All three codecs parse bytes directly; skipping the decode
+            # avoids a full str copy of every response body.
+            payload = _json_loads(raw) if raw else {}
+        except Exception:  # noqa: BLE001
+            payload = {"raw": raw.decode("utf-8", errors="replace")}
+        return int(resp.status), payload
+
+    def _request_via_urllib(
+        self, method: str, path: str, payload_bytes: Optional[bytes]
+    ) -> tuple[int, Dict[str, Any]]:
+        req = url_request.Request(
+            url=f"{self._base_url}{path}",
+            data=payload_bytes,
+            method=method,
+            # urllib can't reuse sockets, so be explicit about closing them.
+            headers={**self._headers, "Connection": "close"},
+        )
+        try:
+            with url_request.urlopen(req, timeout=HTTP_TIMEOUT_SECONDS) as resp:
+                status = resp.getcode()
+                raw = resp.read()
+                payload = _json_loads(raw) if raw else {}
+        except url_error.HTTPError as exc:
+            status = exc.code
+            raw = exc.read()
+            try:
+                payload = _json_loads(raw) if raw else {}
+            except Exception:  # noqa: BLE001
+                payload = {"raw": raw.decode("utf-8", errors="replace")}
+        return status, payload
+
     @staticmethod
     def _error_message(payload: Dict[str, Any]) -> str:
         errors = payload.get("errors")
@@ -309,18 +461,23 @@ class RobotServerClient:
         return str(run_id)
 
     def get_run_status(self, run_id: str) -> Optional[str]:
+        cached = self._run_status_cache.get(run_id)
+        if cached is not None and time.monotonic() - cached[0] < RUN_STATUS_CACHE_TTL_SECONDS:
+            return cached[1]
         payload = self._request_json(
             "GET",
             f"/maintenance_runs/{run_id}",
             expected_statuses=(200, 404),
             retries=1,
         )
+        status: Optional[str] = None
         data = payload.get("data")
         if isinstance(data, dict):
-            status = data.get("status")
-            if isinstance(status, str):
-                return status
-        return None
+            raw_status = data.get("status")
+            if isinstance(raw_status, str):
+                status = raw_status
+        self._run_status_cache[run_id] = (time.monotonic(), status)
+        return status
 
     def wait_until_run_idle(self, run_id: str, timeout_seconds: float) -> None:
         deadline = time.monotonic() + timeout_seconds
@@ -330,10 +487,20 @@ class RobotServerClient:
                 return
             if status == "idle":
                 return
-            time.sleep(POLL_INTERVAL_SECONDS)
+            self._interruptible_sleep(POLL_INTERVAL_SECONDS, deadline)
         raise ApiRequestError(f"Run {run_id} did not become idle within timeout.")
 
+    def _interruptible_sleep(self, delay: float, deadline: float) -> None:
+        # Clamp to the deadline so a slow response never pushes the loop past
+        # its timeout, and wake immediately if the event is set.
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return
+        self._wake.wait(timeout=min(delay, remaining))
+        self._wake.clear()
+
     def delete_run(self, run_id: str) -> None:
+        self._run_status_cache.pop(run_id, None)
         self._request_json(
             "DELETE",
             f"/maintenance_runs/{run_id}",
@@ -355,17 +522,43 @@ class RobotServerClient:
         command_type: str,
         params: Dict[str, Any],
         timeout_seconds: float = COMMAND_TIMEOUT_SECONDS,
+        raw_body: Optional[bytes] = None,
     ) -> Dict[str, Any]:
+        # Any command can change the run's status; don't serve a stale one.
+        self._run_status_cache.pop(run_id, None)
+        # waitUntilComplete has the server hold the POST until the command is
+        # terminal, so the happy path is one round trip with no poll loop. The
+        # hold must end before the client read timeout (HTTP_TIMEOUT_SECONDS)
+        # or the transport gives up while the server is still holding the
+        # connection; commands that outlive the hold come back still-running
+        # and the polling fallback below covers the rest of timeout_seconds.
+        hold_seconds = min(timeout_seconds, HTTP_TIMEOUT_SECONDS - 2.0)
         create_payload = self._request_json(
             "POST",
-            f"/maintenance_runs/{run_id}/commands",
-            body={"data": {"commandType": command_type, "params": params}},
+            f"/maintenance_runs/{run_id}/commands"
+            f"?waitUntilComplete=true&timeout={int(hold_seconds * 1000)}",
+            body=raw_body if raw_body is not None else {"data": {"commandType": command_type, "params": params}},
             expected_statuses=(201,),
-            retries=1,
+            # Never retried: a timeout after the server accepted the POST
+            # would enqueue the motion command a second time. retries=0 keeps
+            # both transports single-shot; the idempotent GET polls keep their
+            # retries.
+            retries=0,
         )
-        command_id = create_payload.get("data", {}).get("id")
+        data = create_payload.get("data", {})
+        command_id = data.get("id")
         if not command_id:
             raise ApiRequestError(f"{command_type}: missing command id from create response.")
+        status = str(data.get("status", ""))
+        if status == "succeeded":
+            return data
+        if status == "failed":
+            error_payload = data.get("error", {})
+            if not isinstance(error_payload, dict):
+                error_payload = {"detail": str(error_payload)}
+            raise CommandExecutionError(command_type, error_payload)
+        # Still queued/running: the server didn't honor the flag (or gave up
+        # before the command finished) — fall back to polling.
         return self._wait_for_command(run_id, str(command_id), command_type, timeout_seconds)
 
     def _wait_for_command(
@@ -376,6 +569,8 @@ class RobotServerClient:
         timeout_seconds: float,
     ) -> Dict[str, Any]:
         deadline = time.monotonic() + timeout_seconds
+        delay = POLL_INITIAL_DELAY_SECONDS
+        last_status = ""
         while time.monotonic() < deadline:
             payload = self._request_json(
                 "GET",
@@ -392,7 +587,13 @@ class RobotServerClient:
                 if not isinstance(error_payload, dict):
                     error_payload = {"detail": str(error_payload)}
                 raise CommandExecutionError(command_type, error_payload)
-            time.sleep(POLL_INTERVAL_SECONDS)
+            if status != last_status:
+                # A transition (queued -> running) means progress; poll
+                # eagerly again before backing off.
+                delay = POLL_INITIAL_DELAY_SECONDS
+                last_status = status
+            self._interruptible_sleep(delay, deadline)
+            delay = min(delay * POLL_BACKOFF_FACTOR, POLL_MAX_DELAY_SECONDS)
         raise ApiRequestError(f"{command_type} command {command_id} timed out.")
 
 
@@ -420,6 +621,9 @@ def _attached_by_mount(instrument_rows: List[Dict[str, Any]]) -> Dict[str, Instr
     return attached
 
 
+# max_volume comes from a handful of fixed pipette families, so a small
+# cache makes repeat calls constant-time.
+@functools.lru_cache(maxsize=16)
 def _volume_test_settings(max_volume: float) -> tuple[float, float, float]:
     test_volume = round(max_volume * TEST_FRACTION, 2)
     aspirate_flow = max(2.0, min(50.0, round(test_volume / 6.0, 2)))
@@ -481,6 +685,7 @@ def _aspirate_from_source(
     transfer_well_location: Dict[str, Any],
     volume: float,
     flow_rate: float,
+    raw_body: Optional[bytes] = None,
 ) -> None:
     client.post_command(
         run_id,
@@ -493,9 +698,15 @@ def _aspirate_from_source(
             "volume": volume,
             "flowRate": flow_rate,
         },
+        raw_body=raw_body,
     )
 
 
+# _ensure_labware may be called from worker threads (see _exercise_mount);
+# the shared cache dict needs a lock around its read/update.
+_labware_cache_lock = threading.Lock()
+
+
 def _ensure_labware(
     client: RobotServerClient,
     run_id: str,
@@ -507,7 +718,8 @@ def _ensure_labware(
     version: int,
     slot_name: str,
 ) -> str:
-    existing = cache.get(cache_key)
+    with _labware_cache_lock:
+        existing = cache.get(cache_key)
     if existing:
         return existing
     result = client.post_command(
@@ -523,7 +735,8 @@ def _ensure_labware(
     labware_id = str(result.get("result", {}).get("labwareId", "")).strip()
     if not labware_id:
         raise RuntimeError(f"loadLabware for {cache_key} returned no labwareId.")
-    cache[cache_key] = labware_id
+    with _labware_cache_lock:
+        cache[cache_key] = labware_id
     return labware_id
 
 
@@ -574,26 +787,17 @@ def _move_to_slot_and_lower(
     mount_name: str,
     lower_distance_mm: float = LOWER_DISTANCE_MM,
 ) -> None:
+    # One moveToCoordinates straight to the lowered height; the final z is
+    # still well above the deck, so the old approach-then-moveRelative pair
+    # (two POST + wait round trips) bought nothing.
+    final_z = TARGET_APPROACH_Z_MM - lower_distance_mm
     _move_mount_to_slot(
         client=client,
         run_id=run_id,
         pipette_id=pipette_id,
         mount_name=mount_name,
         slot_id=TARGET_SLOT,
-        z_height=TARGET_APPROACH_Z_MM,
-    )
-    _log_stderr(
-        "INFO",
-        f"Lowering {mount_name} mount by {lower_distance_mm:.1f} mm.",
-    )
-    client.post_command(
-        run_id,
-        "moveRelative",
-        {
-            "pipetteId": pipette_id,
-            "axis": "z",
-            "distance": -lower_distance_mm,
-        },
+        z_height=final_z,
     )
 
 
@@ -718,26 +922,33 @@ def _exercise_mount(
     tiprack_slot = TIPRACK_SLOT_BY_MOUNT.get(mount_name, TIPRACK_SLOT)
     transfer_well_location = _transfer_well_location()
 
-    tiprack_id = _ensure_labware(
-        client=client,
-        run_id=run_id,
-        cache=labware_cache,
-        cache_key=f"tiprack:{mount_name}:{tiprack_load_name}",
-        load_name=tiprack_load_name,
-        namespace=TIPRACK_NAMESPACE,
-        version=TIPRACK_VERSION,
-        slot_name=tiprack_slot,
-    )
-    trash_id = _ensure_labware(
-        client=client,
-        run_id=run_id,
-        cache=labware_cache,
-        cache_key="trash",
-        load_name=TRASH_LOAD_NAME,
-        namespace=TRASH_NAMESPACE,
-        version=TRASH_VERSION,
-        slot_name=TRASH_SLOT,
-    )
+    # Tiprack and trash loads are independent; overlap their round trips over
+    # the shared connection pool.
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        tiprack_future = executor.submit(
+            _ensure_labware,
+            client=client,
+            run_id=run_id,
+            cache=labware_cache,
+            cache_key=f"tiprack:{mount_name}:{tiprack_load_name}",
+            load_name=tiprack_load_name,
+            namespace=TIPRACK_NAMESPACE,
+            version=TIPRACK_VERSION,
+            slot_name=tiprack_slot,
+        )
+        trash_future = executor.submit(
+            _ensure_labware,
+            client=client,
+            run_id=run_id,
+            cache=labware_cache,
+            cache_key="trash",
+            load_name=TRASH_LOAD_NAME,
+            namespace=TRASH_NAMESPACE,
+            version=TRASH_VERSION,
+            slot_name=TRASH_SLOT,
+        )
+        tiprack_id = tiprack_future.result()
+        trash_id = trash_future.result()
     transfer_plate_id = _load_transfer_plate(
         client=client,
         run_id=run_id,
@@ -765,9 +976,44 @@ def _exercise_mount(
         f"aspirate flow {aspirate_flow} uL/s, dispense flow {dispense_flow} uL/s.",
     )
 
+    # Every cycle posts the same three envelopes; serialize them once here so
+    # the loop body does no dict building or JSON work.
+    prepare_body = _json_dumps_bytes(
+        {"data": {"commandType": "prepareToAspirate", "params": {"pipetteId": pipette_id}}}
+    )
+    aspirate_body = _json_dumps_bytes(
+        {
+            "data": {
+                "commandType": "aspirate",
+                "params": {
+                    "pipetteId": pipette_id,
+                    "labwareId": transfer_plate_id,
+                    "wellName": TRANSFER_SOURCE_WELL,
+                    "wellLocation": transfer_well_location,
+                    "volume": test_volume,
+                    "flowRate": aspirate_flow,
+                },
+            }
+        }
+    )
+    dispense_params = {
+        "pipetteId": pipette_id,
+        "labwareId": transfer_plate_id,
+        "wellName": TRANSFER_DEST_WELL,
+        "wellLocation": transfer_well_location,
+        "volume": test_volume,
+        "flowRate": dispense_flow,
+        "pushOut": 0.0,
+    }
+    dispense_body = _json_dumps_bytes(
+        {"data": {"commandType": "dispense", "params": dispense_params}}
+    )
+
     cycle = 1
     while True:
-        client.post_command(run_id, "prepareToAspirate", {"pipetteId": pipette_id})
+        client.post_command(
+            run_id, "prepareToAspirate", {"pipetteId": pipette_id}, raw_body=prepare_body
+        )
         _log_stderr(
             "INFO",
             f"{pipette_name}@{mount_name} cycle {cycle}: aspirate {test_volume} uL from {TRANSFER_SOURCE_WELL}",
@@ -781,6 +1027,7 @@ def _exercise_mount(
                 transfer_well_location=transfer_well_location,
                 volume=test_volume,
                 flow_rate=aspirate_flow,
+                raw_body=aspirate_body,
             )
         except CommandExecutionError as exc:
             if exc.error_type == "TipNotAttachedError":
@@ -802,6 +1049,7 @@ def _exercise_mount(
                     transfer_well_location=transfer_well_location,
                     volume=test_volume,
                     flow_rate=aspirate_flow,
+                    raw_body=aspirate_body,
                 )
             else:
                 raise
@@ -809,19 +1057,7 @@ def _exercise_mount(
             "INFO",
             f"{pipette_name}@{mount_name} cycle {cycle}: dispense {test_volume} uL to {TRANSFER_DEST_WELL}",
         )
-        client.post_command(
-            run_id,
-            "dispense",
-            {
-                "pipetteId": pipette_id,
-                "labwareId": transfer_plate_id,
-                "wellName": TRANSFER_DEST_WELL,
-                "wellLocation": transfer_well_location,
-                "volume": test_volume,
-                "flowRate": dispense_flow,
-                "pushOut": 0.0,
-            },
-        )
+        client.post_command(run_id, "dispense", dispense_params, raw_body=dispense_body)
         if not _prompt_continue_cycles():
             _log_stderr("INFO", f"Stopping cycle loop for {pipette_name}@{mount_name}.")
             break
@@ -845,7 +1081,22 @@ def _run_impl() -> None:
     _log_stderr("INFO", f"Using OT-2 robot-server host: {host}:{API_PORT}")
 
     client = RobotServerClient(host=host)
-    health = client.health()
+    try:
+        health = client.health()
+    except ApiRequestError:
+        # A cached host may have gone stale; drop the cache and retry once
+        # with a freshly resolved address before giving up.
+        try:
+            HOST_CACHE_PATH.unlink()
+        except OSError:
+            pass
+        fresh_host = _resolve_host()
+        if fresh_host == host:
+            raise
+        _log_stderr("WARN", f"Cached host {host} unreachable; re-resolved to {fresh_host}.")
+        host = fresh_host
+        client = RobotServerClient(host=host)
+        health = client.health()
     _log_stderr(
         "INFO",
         "Connected to robot-server: "
@@ -880,7 +1131,7 @@ def _run_impl() -> None:
         _log_stderr("INFO", f"Created maintenance run {run_id}.")
 
         _log_stderr("INFO", "Homing robot before test sequence.")
-        client.post_command(run_id, "home", {})
+        client.post_command(run_id, "home", {}, raw_body=_HOME_BODY)
 
         for mount_name in mounts_to_test:
             _log_stderr("INFO", f"Starting mount test for {mount_name}.")
@@ -892,7 +1143,7 @@ def _run_impl() -> None:
                 labware_cache=labware_cache,
             )
             _log_stderr("INFO", f"Homing robot after {mount_name} mount test.")
-            client.post_command(run_id, "home", {})
+            client.post_command(run_id, "home", {}, raw_body=_HOME_BODY)
 
         _log_stderr("INFO", "Pipette smoke test complete.")
     finally:
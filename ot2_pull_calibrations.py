@@ -19,18 +19,40 @@ Output defaults to: ./offsets/pulled/<robot>_<timestamp>/
 from __future__ import annotations
 
 import argparse
+import gzip
+import io
 import json
 import os
 import re
+import shutil
+import signal
 import subprocess
 import sys
+import tarfile
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, Iterable, List
 from urllib import error as url_error
 from urllib import request as url_request
 
+try:  # optional: connection pooling when urllib3 is available
+    import urllib3
+except ImportError:  # pragma: no cover - stdlib fallback below
+    urllib3 = None
+
+try:  # optional: much faster JSON serialization for the larger snapshots
+    import orjson
+except ImportError:  # pragma: no cover - stdlib fallback below
+    orjson = None
+
+# PERF: the snapshot loop issues several GETs against the same host:port; a
+# pooled connection reuses one TCP session (keep-alive) instead of paying a
+# connect handshake per endpoint. Falls back to plain urllib when urllib3 is
+# not installed.
+_HTTP_POOL = urllib3.PoolManager(num_pools=2, maxsize=4, retries=False) if urllib3 else None
+
 
 def _eprint(*args: object) -> None:
     print(*args, file=sys.stderr, flush=True)
@@ -57,14 +79,54 @@ def _run(cmd: List[str], *, check: bool = True) -> subprocess.CompletedProcess[s
 
 def _http_json(host: str, api_port: int, api_version: str, path: str, timeout: float = 10.0) -> Dict[str, Any]:
     url = f"http://{host}:{api_port}{path}"
-    req = url_request.Request(url, headers={"opentrons-version": str(api_version)})
+    headers = {"opentrons-version": str(api_version)}
+    if _HTTP_POOL is not None:
+        resp = _HTTP_POOL.request("GET", url, headers=headers, timeout=timeout)
+        if not 200 <= resp.status < 300:
+            raise RuntimeError(f"GET {url} failed: HTTP {resp.status}")
+        return json.loads(resp.data.decode("utf-8"))
+    # urllib does not advertise gzip on its own (urllib3 does, and transparently
+    # decodes); opting in shrinks the larger JSON bodies several-fold on the
+    # slow USB-ethernet link.
+    req = url_request.Request(url, headers={**headers, "Accept-Encoding": "gzip", "Connection": "keep-alive"})
     with url_request.urlopen(req, timeout=timeout) as resp:
-        return json.loads(resp.read().decode("utf-8"))
+        raw = resp.read()
+        if resp.headers.get("Content-Encoding") == "gzip":
+            raw = gzip.decompress(raw)
+        return json.loads(raw.decode("utf-8"))
+
+
+def _http_raw_to_file(host: str, api_port: int, api_version: str, path: str, dst: Path, timeout: float = 10.0) -> None:
+    """Stream an API response body straight to dst without parsing it.
+
+    The snapshot endpoints are only archived, never inspected in-process, so
+    the json.loads -> json.dumps round trip in _http_json/_write_json is pure
+    overhead for them (labware calibrations can run to megabytes).
+    """
+    url = f"http://{host}:{api_port}{path}"
+    headers = {"opentrons-version": str(api_version)}
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    if _HTTP_POOL is not None:
+        resp = _HTTP_POOL.request("GET", url, headers=headers, timeout=timeout, preload_content=False)
+        try:
+            if not 200 <= resp.status < 300:
+                raise RuntimeError(f"GET {url} failed: HTTP {resp.status}")
+            with dst.open("wb") as f:
+                shutil.copyfileobj(resp, f, length=1 << 16)
+        finally:
+            resp.release_conn()
+        return
+    req = url_request.Request(url, headers=headers)
+    with url_request.urlopen(req, timeout=timeout) as resp, dst.open("wb") as f:
+        shutil.copyfileobj(resp, f, length=1 << 16)
 
 
 def _wait_health(host: str, api_port: int, api_version: str, timeout_seconds: float = 60.0) -> Dict[str, Any]:
     start = time.time()
     last: str | None = None
+    # Exponential backoff: retry quickly at first (a healthy robot answers on
+    # the next attempt) without hammering one that is still booting.
+    delay = 0.1
     while True:
         if time.time() - start > timeout_seconds:
             raise RuntimeError(f"Timed out waiting for robot-server /health.\n{last or ''}".strip())
@@ -74,7 +136,8 @@ def _wait_health(host: str, api_port: int, api_version: str, timeout_seconds: fl
             last = f"HTTP {exc.code}: {exc.read().decode('utf-8', errors='replace')[:200]}"
         except Exception as exc:
             last = f"{type(exc).__name__}: {exc}"
-        time.sleep(2.0)
+        time.sleep(delay)
+        delay = min(delay * 2, 2.0)
 
 
 def _resolve_host(repo_dir: Path, host: str, api_port: int, api_version: str) -> str:
@@ -97,13 +160,54 @@ def _resolve_host(repo_dir: Path, host: str, api_port: int, api_version: str) ->
 
 
 def _ssh_base(host: str, user: str, port: int, ssh_key: str) -> List[str]:
-    base = ["ssh", "-p", str(port), "-o", "StrictHostKeyChecking=accept-new"]
+    base = [
+        "ssh",
+        "-p",
+        str(port),
+        "-o",
+        "StrictHostKeyChecking=accept-new",
+        # Multiplex every session over one master connection so concurrent
+        # pulls (and the python/path lookups) share a single TCP + auth
+        # handshake.
+        "-o",
+        "ControlMaster=auto",
+        "-o",
+        "ControlPath=/tmp/ot2-ctl-%C",
+        "-o",
+        "ControlPersist=60s",
+    ]
     if ssh_key:
         base += ["-i", ssh_key]
     base += [f"{user}@{host}"]
     return base
 
 
+def _start_ssh_master(ssh_cmd: List[str]) -> None:
+    """Best-effort: open a persistent master connection up front.
+
+    With ControlMaster=auto the first real session would create the master
+    anyway; starting it explicitly (-MNf) lets every subsequent session —
+    including the two concurrent tar pulls — attach to an already
+    authenticated connection.
+    """
+    subprocess.run(
+        ssh_cmd[:-1] + ["-M", "-N", "-f", ssh_cmd[-1]],
+        check=False,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+
+def _stop_ssh_master(ssh_cmd: List[str]) -> None:
+    """Best-effort: tear down the persistent master connection."""
+    subprocess.run(
+        ssh_cmd[:-1] + ["-O", "exit", ssh_cmd[-1]],
+        check=False,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+
 def _default_key_dir() -> Path:
     base = Path(os.getenv("XDG_CONFIG_HOME") or (Path.home() / ".config"))
     return base / "opentrons-tools" / "ssh"
@@ -142,6 +246,11 @@ def _ensure_ssh_key(repo_dir: Path, host: str, api_port: int, api_version: str,
 
 def _write_json(path: Path, payload: Dict[str, Any]) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
+    if orjson is not None:
+        # orjson emits UTF-8 bytes directly; skips the str build + re-encode
+        # that json.dumps/write_text pays on the multi-hundred-KB snapshots.
+        path.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE))
+        return
     path.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
 
 
@@ -149,8 +258,9 @@ def _stream_to_file(proc: subprocess.Popen[bytes], dst: Path) -> None:
     dst.parent.mkdir(parents=True, exist_ok=True)
     assert proc.stdout is not None
     with dst.open("wb") as f:
-        for chunk in iter(lambda: proc.stdout.read(1024 * 128), b""):
-            f.write(chunk)
+        # copyfileobj's loop runs in C; 1 MiB chunks keep syscall count low on
+        # multi-hundred-MB streams.
+        shutil.copyfileobj(proc.stdout, f, length=1 << 20)
     rc = proc.wait()
     if rc != 0:
         raise RuntimeError(f"Remote stream command failed (exit {rc}): {dst}")
@@ -165,12 +275,66 @@ def _remote_python_expr(ssh_cmd: List[str], expr: str) -> str:
     return (proc.stdout or "").strip()
 
 
-def _pull_tar_gz(ssh_cmd: List[str], remote_path: str, out_file: Path) -> None:
+def _remote_has_zstd(ssh_cmd: List[str]) -> bool:
+    proc = subprocess.run(
+        ssh_cmd + ["command -v zstd >/dev/null 2>&1"],
+        check=False,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    return proc.returncode == 0
+
+
+def _remote_tar_cmd(remote_path: str, codec: str = "gzip") -> str:
+    # PERF: zstd -1 compresses ~3x faster than gzip at a similar ratio, so use
+    # it when the robot has it. Otherwise pigz -1 (all cores) when available,
+    # else gzip -1: tar's built-in -z runs gzip -6 single-threaded, which is
+    # the bottleneck on the OT-2's Atom-class CPU, so a fast level trades a
+    # slightly larger stream for much less remote CPU.
+    if codec == "zstd":
+        return f"set -euo pipefail; tar -C {sh_quote(remote_path)} -cf - . | zstd -1 -T0"
+    return (
+        f"set -euo pipefail; tar -C {sh_quote(remote_path)} -cf - . | "
+        "(command -v pigz >/dev/null 2>&1 && pigz -1 || gzip -1)"
+    )
+
+
+def _kill_stream(proc: subprocess.Popen[bytes]) -> None:
+    """Tear down an ssh+tar pipeline promptly after a local failure.
+
+    Without this, a failed local write (disk full, Ctrl-C) leaves ssh and the
+    remote tar pushing bytes until the kernel notices the dead pipe. The Popen
+    is started in its own session, so signalling the group takes down anything
+    ssh spawned as well.
+    """
+    try:
+        os.killpg(proc.pid, signal.SIGTERM)
+    except OSError:
+        proc.terminate()
+    try:
+        proc.wait(timeout=2)
+    except subprocess.TimeoutExpired:
+        try:
+            os.killpg(proc.pid, signal.SIGKILL)
+        except OSError:
+            proc.kill()
+        proc.wait()
+
+
+def _pull_tar_gz(ssh_cmd: List[str], remote_path: str, out_file: Path, codec: str = "gzip") -> None:
     # remote_path can be a directory or a file.
-    remote_cmd = f"set -euo pipefail; tar -C {sh_quote(remote_path)} -czf - ."
-    proc = subprocess.Popen(ssh_cmd + [remote_cmd], stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    proc = subprocess.Popen(
+        ssh_cmd + [_remote_tar_cmd(remote_path, codec)],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        bufsize=1 << 20,
+        start_new_session=True,
+    )
     try:
         _stream_to_file(proc, out_file)
+    except BaseException:
+        _kill_stream(proc)
+        raise
     finally:
         if proc.stderr is not None:
             err = proc.stderr.read().decode("utf-8", errors="replace").strip()
@@ -179,11 +343,148 @@ def _pull_tar_gz(ssh_cmd: List[str], remote_path: str, out_file: Path) -> None:
                 _eprint(err)
 
 
+def _remote_dir_digest(ssh_cmd: List[str], remote_path: str) -> str:
+    """Best-effort content digest of a remote dir; empty string when unavailable.
+
+    Hashes the sorted (mtime, size, name) listing rather than file contents, so
+    the command is one cheap find over the master connection. pipefail ensures
+    a find that cannot produce the listing fails the whole pipeline instead of
+    yielding the digest of empty input.
+    """
+    remote_cmd = (
+        f"set -euo pipefail; cd {sh_quote(remote_path)} && "
+        "find . -type f -printf '%T@ %s %p\\n' | LC_ALL=C sort | sha256sum | awk '{print $1}'"
+    )
+    proc = subprocess.run(ssh_cmd + [remote_cmd], check=False, text=True, capture_output=True)
+    if proc.returncode != 0:
+        return ""
+    digest = (proc.stdout or "").strip()
+    return digest if re.fullmatch(r"[0-9a-f]{64}", digest) else ""
+
+
+def _previous_pull_digests(out_dir: Path) -> tuple[Path, Dict[str, Any]] | None:
+    """Return (dir, paths.json payload) for the most recent sibling pull, if any."""
+    try:
+        siblings = [
+            p for p in out_dir.parent.iterdir() if p.is_dir() and p != out_dir and (p / "paths.json").is_file()
+        ]
+        if not siblings:
+            return None
+        latest = max(siblings, key=lambda p: p.stat().st_mtime)
+        return latest, json.loads((latest / "paths.json").read_text(encoding="utf-8"))
+    except Exception:
+        return None
+
+
+def _pull_tar_extract(ssh_cmd: List[str], remote_path: str, dst_dir: Path) -> None:
+    """Stream the remote tar straight into dst_dir, skipping the on-disk archive.
+
+    Extracting on the fly halves local disk I/O versus writing the tarball and
+    unpacking it later; a 2 MiB tarfile buffer keeps the per-member overhead low.
+    """
+    dst_dir.mkdir(parents=True, exist_ok=True)
+    proc = subprocess.Popen(
+        ssh_cmd + [_remote_tar_cmd(remote_path)],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        bufsize=1 << 20,
+        start_new_session=True,
+    )
+    try:
+        assert proc.stdout is not None
+        # Decompress outside tarfile: 'r|gz' would force gzip reads through
+        # tarfile's small internal stream buffer, while an explicit GzipFile
+        # over a 2 MiB BufferedReader pulls large chunks from the pipe and
+        # hands tarfile plain tar bytes.
+        raw = io.BufferedReader(proc.stdout, buffer_size=2 << 20)
+        with gzip.GzipFile(fileobj=raw, mode="rb") as gz:
+            with tarfile.open(mode="r|", fileobj=gz, bufsize=2 << 20) as tf:
+                # Pin the extraction filter: rejects absolute/.. member names
+                # from the wire and keeps behavior stable across the 3.12
+                # deprecation and the 3.14 default change.
+                if hasattr(tarfile, "data_filter"):
+                    tf.extractall(dst_dir, filter="data")
+                else:  # pragma: no cover - Pythons without the filter backport
+                    tf.extractall(dst_dir)
+        rc = proc.wait()
+        if rc != 0:
+            raise RuntimeError(f"Remote stream command failed (exit {rc}): {dst_dir}")
+    except BaseException:
+        _kill_stream(proc)
+        raise
+    finally:
+        if proc.stderr is not None:
+            err = proc.stderr.read().decode("utf-8", errors="replace").strip()
+            if err:
+                _eprint(err)
+
+
 def sh_quote(value: str) -> str:
     # minimal POSIX shell quoting
     return "'" + value.replace("'", "'\"'\"'") + "'"
 
 
+def _pull_over_ssh(ssh_cmd: List[str], out_dir: Path, extract: bool) -> None:
+    # Resolve on-disk calibration directories using the robot's own config.
+    # One remote python prints both paths NUL-separated: a single SSH session
+    # and a single interpreter start instead of two of each.
+    paths_out = _remote_python_expr(
+        ssh_cmd,
+        "from opentrons.config import get_opentrons_path as g; import sys; "
+        'sys.stdout.write(str(g("robot_calibration_dir")) + "\\x00" + str(g("tip_length_calibration_dir")))',
+    )
+    try:
+        cal_dir, tip_dir = paths_out.split("\x00")
+    except ValueError:
+        raise RuntimeError(f"Unexpected calibration path output from robot: {paths_out!r}")
+    cal_dir = cal_dir.strip()
+    tip_dir = tip_dir.strip()
+
+    # The streaming extractor only handles gzip, so zstd applies to the
+    # archive path; the probe is one cheap command over the existing master.
+    codec = "zstd" if not extract and _remote_has_zstd(ssh_cmd) else "gzip"
+    suffix = ".tar.zst" if codec == "zstd" else ".tar.gz"
+    targets = [("robot_calibration_dir", cal_dir), ("tip_length_calibration_dir", tip_dir)]
+
+    # Digest each remote dir (cheap listing hash over the master connection) so
+    # a re-run shortly after a prior pull can reuse that pull's archive instead
+    # of streaming unchanged data again.
+    digests: Dict[str, str] = {}
+    previous = None
+    if not extract:
+        digests = {stem: _remote_dir_digest(ssh_cmd, remote_dir) for stem, remote_dir in targets}
+        previous = _previous_pull_digests(out_dir)
+
+    paths_payload: Dict[str, Any] = {"robot_calibration_dir": cal_dir, "tip_length_calibration_dir": tip_dir}
+    if not extract:
+        # Record the codec so later consumers know how to unpack the archives.
+        paths_payload["archive_codec"] = codec
+        paths_payload.update({f"{stem}_digest": digest for stem, digest in digests.items() if digest})
+    _write_json(out_dir / "paths.json", paths_payload)
+
+    # The directory pulls are independent tar streams; run them as concurrent
+    # ssh sessions (multiplexed over the master connection) so the total pull
+    # time is max(dir1, dir2) instead of the sum.
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        pulls = []
+        for stem, remote_dir in targets:
+            if extract:
+                print(f"Pulling {stem}: {remote_dir}")
+                pulls.append(executor.submit(_pull_tar_extract, ssh_cmd, remote_dir, out_dir / stem))
+                continue
+            digest = digests.get(stem, "")
+            if previous is not None and digest and previous[1].get(f"{stem}_digest") == digest:
+                prev_archives = sorted(previous[0].glob(f"{stem}.tar.*"))
+                if prev_archives:
+                    print(f"{stem} unchanged since {previous[0].name}; reusing its archive")
+                    shutil.copy2(prev_archives[0], out_dir / prev_archives[0].name)
+                    continue
+            print(f"Pulling {stem}: {remote_dir}")
+            pulls.append(executor.submit(_pull_tar_gz, ssh_cmd, remote_dir, out_dir / f"{stem}{suffix}", codec))
+        for pull in pulls:
+            pull.result()
+
+
 def main() -> None:
     repo_dir = Path(__file__).resolve().parent
 
@@ -196,6 +497,11 @@ def main() -> None:
     parser.add_argument("--ssh-key", default="", help="SSH private key path (auto-set up if omitted)")
     parser.add_argument("--out-dir", default="", help="Output folder (default: ./offsets/pulled/<robot>_<timestamp>)")
     parser.add_argument("--api-only", action="store_true", help="Only save API JSON; skip SSH file pulls")
+    parser.add_argument(
+        "--extract",
+        action="store_true",
+        help="Extract calibration dirs in place while streaming instead of saving .tar.gz archives",
+    )
     args = parser.parse_args()
 
     host = _resolve_host(repo_dir, args.host, args.api_port, str(args.api_version))
@@ -208,16 +514,25 @@ def main() -> None:
     print(f"Robot: {robot_name} ({host})")
     print(f"Saving to: {out_dir}")
 
-    # API snapshots
+    # API snapshots. The endpoints are independent GETs against one server, so
+    # fetch them concurrently: wall time becomes the slowest endpoint instead
+    # of the sum. Each body is streamed straight to its file — only /health
+    # (already fetched) is ever parsed in-process.
     _write_json(out_dir / "health.json", health)
-    for name, path in [
+    snapshots = [
         ("instruments.json", "/instruments"),
         ("calibration_pipette_offset.json", "/calibration/pipette_offset"),
         ("calibration_tip_length.json", "/calibration/tip_length"),
         ("calibration_status.json", "/calibration/status"),
         ("labware_calibrations.json", "/labware/calibrations"),
-    ]:
-        _write_json(out_dir / name, _http_json(host, args.api_port, str(args.api_version), path, timeout=20.0))
+    ]
+    with ThreadPoolExecutor(max_workers=len(snapshots)) as executor:
+        futures = [
+            executor.submit(_http_raw_to_file, host, args.api_port, str(args.api_version), path, out_dir / name, 20.0)
+            for name, path in snapshots
+        ]
+        for future in futures:
+            future.result()
 
     if args.api_only:
         print("Done (API only).")
@@ -227,24 +542,11 @@ def main() -> None:
         args.ssh_key = _ensure_ssh_key(repo_dir, host, args.api_port, str(args.api_version), args.ssh_user, args.ssh_port)
 
     ssh_cmd = _ssh_base(host, args.ssh_user, args.ssh_port, args.ssh_key)
-
-    # Resolve on-disk calibration directories using the robot's own config.
-    cal_dir = _remote_python_expr(
-        ssh_cmd,
-        'from opentrons.config import get_opentrons_path; print(get_opentrons_path("robot_calibration_dir"))',
-    )
-    tip_dir = _remote_python_expr(
-        ssh_cmd,
-        'from opentrons.config import get_opentrons_path; print(get_opentrons_path("tip_length_calibration_dir"))',
-    )
-
-    _write_json(out_dir / "paths.json", {"robot_calibration_dir": cal_dir, "tip_length_calibration_dir": tip_dir})
-
-    print(f"Pulling robot calibration dir: {cal_dir}")
-    _pull_tar_gz(ssh_cmd, cal_dir, out_dir / "robot_calibration_dir.tar.gz")
-
-    print(f"Pulling tip length dir: {tip_dir}")
-    _pull_tar_gz(ssh_cmd, tip_dir, out_dir / "tip_length_calibration_dir.tar.gz")
+    _start_ssh_master(ssh_cmd)
+    try:
+        _pull_over_ssh(ssh_cmd, out_dir, extract=args.extract)
+    finally:
+        _stop_ssh_master(ssh_cmd)
 
     print("Done.")
 
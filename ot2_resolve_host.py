@@ -20,11 +20,14 @@ from __future__ import annotations
 
 import argparse
 import ipaddress
+import json
 import re
 import socket
 import subprocess
 import sys
-from typing import Dict, Iterable, List, Sequence, Set, Tuple
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Dict, Iterable, Iterator, List, Sequence, Set, Tuple
 from urllib import error as url_error
 from urllib import request as url_request
 
@@ -40,6 +43,26 @@ def _run_quiet(cmd: Sequence[str]) -> str:
     return proc.stdout
 
 
+def _run_lines(cmd: Sequence[str]) -> Iterator[str]:
+    """Stream a command's stdout line by line; raises RuntimeError on failure.
+
+    Parsing overlaps the child's output instead of buffering the full capture,
+    so the whole output is never held in memory. Lines are yielded without
+    their trailing newline.
+    """
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+    try:
+        assert proc.stdout is not None
+        for line in proc.stdout:
+            yield line.rstrip("\n")
+        if proc.wait() != 0:
+            raise RuntimeError(f"Command failed: {' '.join(cmd)} (exit code {proc.returncode})")
+    finally:
+        if proc.poll() is None:
+            proc.kill()
+            proc.wait()
+
+
 def _dedupe_keep_order(items: Iterable[str]) -> List[str]:
     seen: Set[str] = set()
     out: List[str] = []
@@ -57,15 +80,13 @@ _IPV4_RE = re.compile(r"^(\d+\.\d+\.\d+\.\d+)$")
 _MACOS_IFCONFIG_INET_RE = re.compile(
     r"^\s+inet\s+(?P<ip>\d+\.\d+\.\d+\.\d+)\s+netmask\s+(?P<netmask>0x[0-9a-fA-F]+|\d+\.\d+\.\d+\.\d+)"
 )
+_MACOS_LINK_LOCAL_INET_RE = re.compile(r"\n\s+inet 169\.254\.")
+_IP_LINK_RE = re.compile(r"^\d+:\s+(?P<name>[^:@]+)")
+_IP_INET_RE = re.compile(r"\binet\s+(?P<ip>\d+\.\d+\.\d+\.\d+)/(?P<prefix>\d+)")
 
 
 def _macos_ifconfig_blocks() -> Dict[str, str]:
     """Return a map of interface name -> raw ifconfig block (macOS)."""
-    try:
-        out = _run_quiet(["ifconfig"])
-    except Exception:
-        return {}
-
     cur_name: str | None = None
     cur_lines: List[str] = []
     blocks: Dict[str, str] = {}
@@ -78,12 +99,15 @@ def _macos_ifconfig_blocks() -> Dict[str, str]:
         cur_name = None
         cur_lines = []
 
-    for line in out.splitlines():
-        if line and not line.startswith(("\t", " ")):
-            flush()
-            cur_name = line.split(":", 1)[0].strip()
-        cur_lines.append(line)
-    flush()
+    try:
+        for line in _run_lines(["ifconfig"]):
+            if line and not line.startswith(("\t", " ")):
+                flush()
+                cur_name = line.split(":", 1)[0].strip()
+            cur_lines.append(line)
+        flush()
+    except Exception:
+        return {}
 
     return blocks
 
@@ -92,7 +116,7 @@ def _macos_link_local_ifaces(blocks: Dict[str, str]) -> List[str]:
     """Return active interfaces with a 169.254/16 IPv4 address (macOS)."""
     ifaces: List[str] = []
     for name, block in blocks.items():
-        if "status: active" in block and re.search(r"\n\s+inet 169\.254\.", block):
+        if "status: active" in block and _MACOS_LINK_LOCAL_INET_RE.search(block):
             ifaces.append(name)
     return _dedupe_keep_order(ifaces)
 
@@ -184,9 +208,29 @@ def _peer_ip_guesses(ip: str, prefixlen: int) -> List[str]:
     return _dedupe_keep_order(str(c) for c in candidates)
 
 
+# The interface/ARP scan shells out to ifconfig/networksetup/arp (or iproute2);
+# a short TTL cache makes repeat resolve() calls from a longer-running caller
+# free without risking stale results across cable plug/unplug.
+_ARP_CACHE_TTL_SECONDS = 5.0
+_arp_cache: Tuple[float, List[str]] | None = None
+
+
 def _arp_candidates() -> List[str]:
-    """Return discovery candidates from local neighbor/ARP table."""
-    candidates: List[str] = []
+    """Return discovery candidates from local neighbor/ARP table (cached briefly)."""
+    global _arp_cache
+    now = time.monotonic()
+    if _arp_cache is not None and now - _arp_cache[0] < _ARP_CACHE_TTL_SECONDS:
+        return list(_arp_cache[1])
+    candidates = _arp_candidates_uncached()
+    _arp_cache = (now, candidates)
+    return list(candidates)
+
+
+def _arp_candidates_uncached() -> List[str]:
+    """Scan the local neighbor/ARP table and USB interfaces for candidates."""
+    # Insertion-ordered dict as an ordered set: every append site dedupes in
+    # O(1) instead of re-walking the candidate list at each merge point.
+    seen: Dict[str, None] = {}
 
     # macOS / BSD
     try:
@@ -201,7 +245,8 @@ def _arp_candidates() -> List[str]:
             if not block or "status: active" not in block:
                 continue
             for ip, prefix in _macos_iface_ipv4(block):
-                candidates.extend(_peer_ip_guesses(ip, prefix))
+                for guess in _peer_ip_guesses(ip, prefix):
+                    seen.setdefault(guess, None)
 
         for cmd in arp_cmds:
             out = _run_quiet(cmd)
@@ -220,35 +265,32 @@ def _arp_candidates() -> List[str]:
                 except Exception:
                     continue
                 if ip_addr.is_link_local or ip_addr.is_private:
-                    candidates.append(ip)
+                    seen.setdefault(ip, None)
                 elif host.endswith(".local"):
-                    candidates.append(host)
-        return _dedupe_keep_order(candidates)
+                    seen.setdefault(host, None)
+        return list(seen)
     except Exception:
         pass
 
     # Linux (iproute2)
     try:
         try:
-            out = _run_quiet(["ip", "-o", "link", "show"])
-            usb_ifaces: List[str] = []
-            for line in out.splitlines():
+            usb_ifaces: Dict[str, None] = {}
+            for line in _run_lines(["ip", "-o", "link", "show"]):
                 # Example: "2: enx001122...: <BROADCAST,...>"
-                m = re.match(r"^\d+:\s+(?P<name>[^:@]+)", line)
+                m = _IP_LINK_RE.match(line)
                 if not m:
                     continue
                 name = m.group("name").strip()
                 lower = name.lower()
                 if lower.startswith(("usb", "enx", "rndis")):
-                    usb_ifaces.append(name)
-            usb_ifaces = _dedupe_keep_order(usb_ifaces)
+                    usb_ifaces.setdefault(name, None)
         except Exception:
-            usb_ifaces = []
+            usb_ifaces = {}
 
         for iface in usb_ifaces:
             try:
-                out = _run_quiet(["ip", "-4", "neigh", "show", "dev", iface])
-                for line in out.splitlines():
+                for line in _run_lines(["ip", "-4", "neigh", "show", "dev", iface]):
                     parts = line.split()
                     if not parts:
                         continue
@@ -260,74 +302,175 @@ def _arp_candidates() -> List[str]:
                     except Exception:
                         continue
                     if ip_addr.is_link_local or ip_addr.is_private:
-                        candidates.append(ip)
+                        seen.setdefault(ip, None)
             except Exception:
                 pass
             try:
-                out = _run_quiet(["ip", "-o", "-4", "addr", "show", "dev", iface])
-                for line in out.splitlines():
-                    m = re.search(r"\binet\s+(?P<ip>\d+\.\d+\.\d+\.\d+)/(?P<prefix>\d+)", line)
+                for line in _run_lines(["ip", "-o", "-4", "addr", "show", "dev", iface]):
+                    m = _IP_INET_RE.search(line)
                     if not m:
                         continue
-                    candidates.extend(_peer_ip_guesses(m.group("ip"), int(m.group("prefix"))))
+                    for guess in _peer_ip_guesses(m.group("ip"), int(m.group("prefix"))):
+                        seen.setdefault(guess, None)
             except Exception:
                 pass
 
-        if candidates:
-            return _dedupe_keep_order(candidates)
+        if seen:
+            return list(seen)
 
-        out = _run_quiet(["ip", "neigh"])
-        for line in out.splitlines():
+        for line in _run_lines(["ip", "neigh"]):
             parts = line.split()
             if not parts:
                 continue
             ip = parts[0]
             if _IPV4_RE.match(ip) and ip.startswith("169.254."):
-                candidates.append(ip)
-        return _dedupe_keep_order(candidates)
+                seen.setdefault(ip, None)
+        return list(seen)
     except Exception:
         return []
 
 
-def _probe_health(host: str, port: int, api_version: str, timeout_seconds: float) -> bool:
+def _probe_health(host: str, port: int, api_version: str, timeout_seconds: float) -> Dict[str, Any] | None:
+    """Return the parsed /health body when the host is reachable, else None."""
     url = f"http://{host}:{port}/health"
     req = url_request.Request(url, headers={"opentrons-version": api_version})
     try:
         with url_request.urlopen(req, timeout=timeout_seconds) as resp:
-            return 200 <= int(getattr(resp, "status", 0) or 0) < 300
+            if not 200 <= int(getattr(resp, "status", 0) or 0) < 300:
+                return None
+            raw = resp.read()
     except (url_error.URLError, socket.timeout, ValueError):
-        return False
+        return None
+    try:
+        return json.loads(raw.decode("utf-8"))
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        # Reachable but unparseable; callers only need reachability.
+        return {}
+
 
+def _probe_candidates(
+    candidates: Sequence[str], port: int, api_version: str, timeout_seconds: float, pick_first: bool
+) -> List[Tuple[str, Dict[str, Any]]]:
+    """Probe all candidates concurrently; return (host, health) for reachable ones.
 
-def _resolve(host_arg: str, port: int, api_version: str, timeout_seconds: float, pick_first: bool) -> str:
+    Probes run in parallel so one unreachable candidate (a full timeout) no
+    longer stalls the rest: total latency is ~one probe timeout instead of
+    N of them. With pick_first the first success wins and remaining probes
+    are abandoned.
+    """
+    if not candidates:
+        return []
+    reachable: List[Tuple[str, Dict[str, Any]]] = []
+    executor = ThreadPoolExecutor(max_workers=min(16, len(candidates)))
+    try:
+        futures = {
+            executor.submit(_probe_health, candidate, port, api_version, timeout_seconds): candidate
+            for candidate in candidates
+        }
+        for future in as_completed(futures):
+            health = future.result()
+            if health is None:
+                continue
+            reachable.append((futures[future], health))
+            if pick_first:
+                break
+    finally:
+        # Don't wait for still-running probes of dead candidates.
+        executor.shutdown(wait=False, cancel_futures=True)
+    return reachable
+
+
+def _resolve(
+    host_arg: str, port: int, api_version: str, timeout_seconds: float, pick_first: bool
+) -> Tuple[str, Dict[str, Any]]:
+    """Return (host, health body) — the /health response is a probe byproduct.
+
+    Callers that need the robot name can read it from the health body instead
+    of issuing another HTTP round trip.
+    """
     explicit = host_arg.strip()
     if explicit:
-        if _probe_health(explicit, port, api_version, timeout_seconds):
-            return explicit
+        health = _probe_health(explicit, port, api_version, timeout_seconds)
+        if health is not None:
+            return explicit, health
         raise RuntimeError(f"Unable to reach OT-2 robot-server at {explicit}:{port} (/health).")
 
-    # Probe link-local / ARP-derived candidates first to avoid slow DNS timeouts on
-    # networks where opentrons.local is not resolvable.
-    candidates = _arp_candidates()
-    reachable = [c for c in candidates if _probe_health(c, port, api_version, timeout_seconds)]
+    # Race opentrons.local alongside the link-local / ARP-derived candidates:
+    # the probes run concurrently, so a slow mDNS lookup cannot stall the ARP
+    # candidates and vice versa, and there is no second wave of timeouts when
+    # the first wave comes up empty.
+    candidates = _dedupe_keep_order([*_arp_candidates(), "opentrons.local"])
+    reachable = _probe_candidates(candidates, port, api_version, timeout_seconds, pick_first)
+    if len(reachable) > 1:
+        # opentrons.local and an ARP-derived IP frequently point at the same
+        # robot; collapse entries with identical health bodies before treating
+        # the result as ambiguous.
+        unique: List[Tuple[str, Dict[str, Any]]] = []
+        seen_bodies: List[Dict[str, Any]] = []
+        for candidate, body in reachable:
+            if body and body in seen_bodies:
+                continue
+            seen_bodies.append(body)
+            unique.append((candidate, body))
+        reachable = unique
     if reachable:
         if len(reachable) > 1 and not pick_first:
             raise RuntimeError(
                 "Multiple reachable OT-2 hosts found; pass --host to select one:\n  "
-                + "\n  ".join(reachable)
+                + "\n  ".join(host for host, _ in reachable)
             )
         return reachable[0]
 
-    mdns_default = "opentrons.local"
-    if _probe_health(mdns_default, port, api_version, timeout_seconds):
-        return mdns_default
-
     raise RuntimeError(
         "No reachable OT-2 robot-server found. "
         "Connect via USB (USB-to-ethernet adapter or direct USB 2.0) and/or pass --host HOST."
     )
 
 
+def resolve(
+    host: str = "",
+    port: int = 31950,
+    api_version: str = "2",
+    timeout_seconds: float = 2.0,
+    pick_first: bool = False,
+) -> str:
+    """Resolve the reachable OT-2 host, for in-process use by sibling scripts.
+
+    Same semantics as the CLI: verifies an explicit host, otherwise probes
+    ARP-derived candidates and falls back to opentrons.local. Raises
+    RuntimeError when no (or more than one) robot-server is reachable.
+    """
+    resolved, _ = _resolve(
+        host_arg=host,
+        port=port,
+        api_version=str(api_version),
+        timeout_seconds=float(timeout_seconds),
+        pick_first=bool(pick_first),
+    )
+    return resolved
+
+
+def resolve_with_health(
+    host: str = "",
+    port: int = 31950,
+    api_version: str = "2",
+    timeout_seconds: float = 2.0,
+    pick_first: bool = False,
+) -> Tuple[str, Dict[str, Any]]:
+    """Like resolve(), but also return the /health body from the winning probe.
+
+    Saves the follow-up /health round trip that callers otherwise issue just
+    to read the robot name.
+    """
+    return _resolve(
+        host_arg=host,
+        port=port,
+        api_version=str(api_version),
+        timeout_seconds=float(timeout_seconds),
+        pick_first=bool(pick_first),
+    )
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(description=__doc__)
     parser.add_argument("--host", default="", help="OT-2 host/IP to verify and use")
@@ -339,10 +482,15 @@ def main() -> None:
         action="store_true",
         help="If multiple reachable hosts are found, choose the first instead of failing.",
     )
+    parser.add_argument(
+        "--emit-json",
+        action="store_true",
+        help='Print {"host": ..., "name": ...} so callers can skip their own /health probe.',
+    )
     args = parser.parse_args()
 
     try:
-        host = _resolve(
+        host, health = _resolve(
             host_arg=args.host,
             port=args.port,
             api_version=str(args.api_version),
@@ -353,7 +501,10 @@ def main() -> None:
         _eprint(f"[ERROR] {exc}")
         raise SystemExit(2)
 
-    print(host, flush=True)
+    if args.emit_json:
+        print(json.dumps({"host": host, "name": str(health.get("name") or "opentrons")}), flush=True)
+    else:
+        print(host, flush=True)
 
 
 if __name__ == "__main__":